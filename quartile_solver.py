@@ -42,13 +42,15 @@ from __future__ import annotations
 
 import argparse
 import itertools
+import marshal
 import textwrap
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Iterable, List, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Sequence, Set, Tuple
 
 try:
-    from wordfreq import zipf_frequency, top_n_list
+    from wordfreq import get_frequency_dict, iter_wordlist
 except ImportError as exc:  # pragma: no cover
     raise SystemExit(
         "wordfreq is required – run `pip install wordfreq rich`"
@@ -64,32 +66,78 @@ except ImportError:
 else:
     rich_available = True
 
+try:
+    import numpy as np
+except ImportError:
+    # Pure-Python fallbacks cover everything numpy accelerates
+    numpy_available = False
+else:
+    numpy_available = True
+
+try:
+    from numba import njit
+except ImportError:
+    # Fall back to the pure-Python DFS if numba isn’t available
+    numba_available = False
+else:
+    numba_available = numpy_available
+
 console = Console() if rich_available else None
 
 ###############################################################################
 # Dictionary helpers
 ###############################################################################
 
-WORDSET_PATH = Path(__file__).with_suffix(".wordset")  # optional cached list
+WORDSET_PATH = Path(__file__).with_suffix(".wordset.marshal")  # cached frozenset
 
 
 def build_wordset(min_zipf: float = 3.5) -> Set[str]:
     """Return a set of reasonably common words.
 
-    `wordfreq.top_n_list` is scored by Zipf frequency. 3.5 ≈ appears once in
-    3–10 million words – tweak if you want a larger/smaller lexicon.
+    Zipf 3.5 ≈ appears once in 3–10 million words – tweak if you want a
+    larger/smaller lexicon. ``iter_wordlist`` yields words in descending
+    frequency, so we just walk it until the first entry below the cutoff
+    instead of re-scoring every word with a ``zipf_frequency`` call.
     """
-    words: List[str] = top_n_list("en", n_top=120_000, ranker="zipf")
-    return {w.lower() for w in words if zipf_frequency(w, "en") >= min_zipf}
+    freqs = get_frequency_dict("en")
+    threshold = 10 ** (min_zipf - 9)  # Zipf = log10 of frequency per 10^9 words
+    wordset: Set[str] = set()
+    for w in iter_wordlist("en"):
+        if freqs.get(w, 0.0) < threshold:
+            break
+        wordset.add(w.lower())
+    return wordset
+
+
+Trie = Dict  # nested {char: Trie}; the ``None`` key marks a complete word
+
 
+def build_trie(words: Iterable[str]) -> Trie:
+    """Build a character-level prefix trie; terminals store the full word."""
+    trie: Trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[None] = word
+    return trie
 
-def load_wordset() -> Set[str]:
-    """Load (or build & cache) the word list."""
+
+def load_wordset() -> FrozenSet[str]:
+    """Load (or build & cache) the word list.
+
+    The cache is a marshalled frozenset rather than newline text: marshal
+    deserializes in one C-level pass instead of splitting/stripping ~100k
+    lines into fresh strings, and a read-only frozenset hashes/probes a bit
+    faster than a mutable set.
+    """
     if WORDSET_PATH.exists():
-        return {w.strip() for w in WORDSET_PATH.read_text().splitlines() if w}
+        with WORDSET_PATH.open("rb") as fh:
+            return marshal.load(fh)
 
-    wordset = build_wordset()
-    WORDSET_PATH.write_text("\n".join(sorted(wordset)))
+    wordset = frozenset(build_wordset())
+    with WORDSET_PATH.open("wb") as fh:
+        marshal.dump(wordset, fh)
     return wordset
 
 
@@ -99,25 +147,264 @@ def load_wordset() -> Set[str]:
 
 Tile = str
 Word = str
-Combination = Tuple[int, ...]  # tuple of tile indices used in order
+Mask = int  # 20-bit set of tile indices, bit i = tiles[i]
+
+
+_HIST_CACHE: Dict[int, Tuple] = {}
+
+
+def _letter_cols(data: bytes) -> "np.ndarray":
+    """Map each byte to a histogram column: a–z → 0–25, anything else → 26."""
+    arr = np.frombuffer(data, dtype=np.uint8).astype(np.int16) - 97
+    return np.where((arr >= 0) & (arr < 26), arr, 26)
+
+
+def _word_histograms(wordset: FrozenSet[str]) -> Tuple[List[str], "np.ndarray", "np.ndarray"]:
+    """Per-word letter histograms for ``wordset``, built once and cached."""
+    cached = _HIST_CACHE.get(id(wordset))
+    if cached is not None:
+        return cached[1:]
+
+    words = list(wordset)
+    encoded = [w.encode("utf-8") for w in words]
+    lengths = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+    byte_lengths = np.fromiter(map(len, encoded), dtype=np.int32, count=len(words))
+    owner = np.repeat(np.arange(len(words)), byte_lengths)
+    hist = np.zeros((len(words), 27), dtype=np.uint8)
+    np.add.at(hist, (owner, _letter_cols(b"".join(encoded))), 1)
+
+    # pin the wordset so the id() key can't be recycled behind our back
+    _HIST_CACHE[id(wordset)] = (wordset, words, lengths, hist)
+    return words, lengths, hist
+
+
+def feasible_words(tiles: Sequence[Tile], wordset: FrozenSet[str]) -> Set[str]:
+    """Filter ``wordset`` down to words these tiles could possibly spell.
+
+    A word only deserves a trie node if its letter multiset fits inside the
+    tiles' combined letters and it is no longer than the four longest tiles
+    laid end to end. One O(|wordset|) pass shrinks a ~100k-word lexicon to a
+    few thousand entries before the prefix trie is built. With numpy the
+    multiset test runs as a single vectorized comparison over an N×27
+    histogram matrix instead of building a Counter per word.
+    """
+    maxlen = sum(sorted(map(len, tiles), reverse=True)[:4])
+
+    if numpy_available:
+        words, lengths, hist = _word_histograms(wordset)
+        avail_vec = np.bincount(
+            _letter_cols("".join(tiles).encode("utf-8")), minlength=27
+        ).astype(np.uint8)
+        mask = (lengths <= maxlen) & (hist <= avail_vec).all(axis=1)
+        return {words[k] for k in np.nonzero(mask)[0]}
+
+    avail = Counter("".join(tiles))
+    return {w for w in wordset if len(w) <= maxlen and not (Counter(w) - avail)}
+
+
+_BLOOM_SIZE = 1 << 17  # slots; must be a power of two
+
+
+def build_prefix_bloom(words: Iterable[str], max_prefix: int = 4) -> bytearray:
+    """Mark every short (≤ ``max_prefix`` chars) word prefix in a bloom filter.
+
+    A negative lookup proves no word starts with that prefix, so callers can
+    reject a whole branch with one hash instead of a character-by-character
+    trie walk. Keyed by ``hash()``, which is salted per process – build and
+    query within the same run, never cache to disk.
+    """
+    bloom = bytearray(_BLOOM_SIZE)
+    for word in words:
+        for k in range(1, min(max_prefix, len(word)) + 1):
+            bloom[hash(word[:k]) & (_BLOOM_SIZE - 1)] = 1
+    return bloom
+
+
+def build_tile_trie(
+    trie: Trie, tiles: Sequence[Tile], bloom: bytearray = None,
+) -> Trie:
+    """Compile a character trie into one keyed by tile index.
+
+    Each transition swallows a whole tile with a single ``node.get(i)``
+    instead of one dict lookup per character, so the enumeration DFS never
+    touches strings at all. Compiled subtrees are shared, so duplicate tile
+    strings cost nothing extra. When a prefix ``bloom`` is supplied, dead
+    extensions are rejected with one hash before their characters are
+    walked at all.
+    """
+    memo: Dict[int, Trie] = {}
+
+    def compile_node(node: Trie, prefix: str) -> Trie:
+        out = memo.get(id(node))
+        if out is not None:
+            return out
+        out = memo[id(node)] = {}
+        word = node.get(None)
+        if word is not None:
+            out[None] = word
+        for i, tile in enumerate(tiles):
+            extended = prefix + tile
+            if (
+                bloom is not None
+                and len(extended) <= 4
+                and not bloom[hash(extended) & (_BLOOM_SIZE - 1)]
+            ):
+                continue
+            child = node
+            for ch in tile:
+                child = child.get(ch)
+                if child is None:
+                    break
+            else:
+                out[i] = compile_node(child, extended)
+        return out
+
+    return compile_node(trie, "")
+
+
+def _flatten_tile_trie(
+    tile_trie: Trie, n_tiles: int,
+) -> Tuple["np.ndarray", "np.ndarray", List[Word]]:
+    """Flatten the dict trie into (next_node, word_at, words) arrays.
+
+    ``next_node[node, tile]`` is the child node id or -1; ``word_at[node]``
+    indexes into ``words`` or is -1. Shared subtrees keep a single id.
+    """
+    nodes = [tile_trie]
+    ids = {id(tile_trie): 0}
+    next_rows: List[List[int]] = []
+    word_at: List[int] = []
+    words: List[Word] = []
+
+    k = 0
+    while k < len(nodes):
+        node = nodes[k]
+        row = [-1] * n_tiles
+        for t, child in node.items():
+            if t is None:
+                continue
+            j = ids.get(id(child))
+            if j is None:
+                j = ids[id(child)] = len(nodes)
+                nodes.append(child)
+            row[t] = j
+        next_rows.append(row)
+        word = node.get(None)
+        if word is None:
+            word_at.append(-1)
+        else:
+            word_at.append(len(words))
+            words.append(word)
+        k += 1
+
+    return (
+        np.array(next_rows, dtype=np.int32),
+        np.array(word_at, dtype=np.int32),
+        words,
+    )
+
+
+if numba_available:
+
+    @njit(cache=True)
+    def _candidate_dfs(next_node, word_at, n_tiles, max_tiles):
+        """Iterative DFS over the flat trie; returns (masks, lens, word_ids)."""
+        cap = 1024
+        out_masks = np.empty(cap, dtype=np.int32)
+        out_lens = np.empty(cap, dtype=np.int8)
+        out_words = np.empty(cap, dtype=np.int32)
+        count = 0
+
+        path = np.empty(max_tiles, dtype=np.int8)
+        node_stack = np.empty(max_tiles + 1, dtype=np.int32)
+        tile_ix = np.zeros(max_tiles + 1, dtype=np.int32)
+        node_stack[0] = 0
+        used = 0
+        depth = 0
+
+        while depth >= 0:
+            node = node_stack[depth]
+            t = tile_ix[depth]
+            pushed = False
+            while t < n_tiles:
+                child = next_node[node, t]
+                if child >= 0 and not (used >> t) & 1:
+                    tile_ix[depth] = t + 1
+                    path[depth] = t
+                    used |= 1 << t
+                    depth += 1
+                    node_stack[depth] = child
+                    # at max depth there is nothing left to try – pop at once
+                    tile_ix[depth] = n_tiles if depth == max_tiles else 0
+                    w = word_at[child]
+                    if w >= 0:
+                        if count == cap:  # grow by doubling
+                            cap *= 2
+                            new_masks = np.empty(cap, dtype=np.int32)
+                            new_masks[:count] = out_masks
+                            out_masks = new_masks
+                            new_lens = np.empty(cap, dtype=np.int8)
+                            new_lens[:count] = out_lens
+                            out_lens = new_lens
+                            new_words = np.empty(cap, dtype=np.int32)
+                            new_words[:count] = out_words
+                            out_words = new_words
+                        out_masks[count] = used
+                        out_lens[count] = depth
+                        out_words[count] = w
+                        count += 1
+                    pushed = True
+                    break
+                t += 1
+            if not pushed:
+                depth -= 1
+                if depth >= 0:
+                    used ^= 1 << path[depth]
+
+        return out_masks[:count], out_lens[:count], out_words[:count]
 
 
 def generate_candidates(
     tiles: Sequence[Tile],
-    wordset: Set[str],
+    tile_trie: Trie,
     max_tiles: int = 4,
-) -> List[Tuple[Combination, Word]]:
-    """Return [(combo, word)] for every valid word from ≤ ``max_tiles`` tiles."""
-    candidates: List[Tuple[Combination, Word]] = []
-    indices = range(len(tiles))
-
-    # length‑1 combos first to help short‑circuit impossible searches later
-    for r in range(1, max_tiles + 1):
-        for combo in itertools.permutations(indices, r):
-            word = "".join(tiles[i] for i in combo)
-            if word in wordset:
-                candidates.append((combo, word))
-    return candidates
+) -> Dict[int, List[Tuple[Mask, Word]]]:
+    """Return {tile count: [(mask, word)]} for every valid ≤ ``max_tiles`` word.
+
+    Rather than hashing all ~123k tile permutations, walk the tile-keyed
+    trie – any branch whose prefix starts no word dies instantly, and each
+    DFS step is a single transition on the tile index. With numba installed
+    the walk runs as machine code over a flat int32 trie; otherwise a
+    pure-Python recursion over the dict trie does the same job. The DFS
+    knows each combo's length at emission, so candidates land directly in
+    per-length buckets instead of being re-partitioned by the caller.
+    Candidates carry just the tile mask – a single int – since nothing
+    downstream needs the ordering of the tiles.
+    """
+    buckets: Dict[int, List[Tuple[Mask, Word]]] = {
+        r: [] for r in range(1, max_tiles + 1)
+    }
+
+    if numba_available:
+        next_node, word_at, words = _flatten_tile_trie(tile_trie, len(tiles))
+        cand_masks, lens, word_ids = _candidate_dfs(
+            next_node, word_at, len(tiles), max_tiles
+        )
+        for k in range(len(lens)):
+            buckets[int(lens[k])].append(
+                (int(cand_masks[k]), words[word_ids[k]])
+            )
+        return buckets
+
+    def dfs(node: Trie, used_mask: int, depth: int) -> None:
+        for i, child in node.items():
+            if i is None:
+                buckets[depth].append((used_mask, child))
+            elif depth < max_tiles and not used_mask & (1 << i):
+                dfs(child, used_mask | (1 << i), depth + 1)
+
+    dfs(tile_trie, 0, 0)
+    return buckets
 
 
 ###############################################################################
@@ -126,42 +413,62 @@ def generate_candidates(
 
 def find_perfect_quartiles(
     tiles: Sequence[Tile],
-    quartile_candidates: List[Tuple[Combination, Word]],
-) -> List[List[Tuple[Combination, Word]]]:
-    """Return every way to cover *all* tiles with 5 disjoint 4‑tile words."""
-
-    solutions: List[List[Tuple[Combination, Word]]] = []
-    used = [False] * len(tiles)
-
-    def backtrack(
-        start: int, stack: List[Tuple[Combination, Word]],
-    ) -> None:
-        if len(stack) == 5:
-            # Have we consumed every tile exactly once?
-            if all(used):
-                solutions.append(stack.copy())
+    quartile_candidates: List[Tuple[Mask, Word]],
+) -> Iterator[List[List[Word]]]:
+    """Yield every way to cover *all* tiles with 5 disjoint 4‑tile words.
+
+    Each solution is a list of five word groups; the words within a group
+    are anagram variants built from the same four tiles. Solutions are
+    yielded as found, so callers can stop after the first N without paying
+    for the rest of the search.
+    """
+
+    full_mask = (1 << len(tiles)) - 1
+
+    # For the cover search only the *set* of tiles matters, so collapse
+    # candidates that spell different orderings of the same tiles into one
+    # entry per 20-bit mask – overlap checks stay a single AND and the
+    # backtracker never explores anagram-duplicate branches.
+    words_by_mask: Dict[Mask, List[Word]] = defaultdict(list)
+    for mask, word in quartile_candidates:
+        if word not in words_by_mask[mask]:
+            words_by_mask[mask].append(word)
+    # contiguous machine ints scan better than a list of boxed ints
+    masks = array("i", words_by_mask)
+    groups = list(words_by_mask.values())  # parallel to masks
+
+    # index candidates by tile: each level only tries words covering the
+    # lowest still-free tile (Algorithm X's column heuristic), instead of
+    # rescanning every remaining candidate
+    by_tile: List[List[int]] = [[] for _ in tiles]
+    for i, m in enumerate(masks):
+        for idx in range(len(tiles)):
+            if m >> idx & 1:
+                by_tile[idx].append(i)
+
+    # one preallocated path buffer shared by every level of the recursion –
+    # slots are indexed by depth, so there is no per-node list churn at all
+    path = [0] * 5
+
+    # the hot path emits just a 5-tuple of candidate indices; resolving the
+    # word groups happens once per solution at the generator boundary below
+    def backtrack(used_mask: int, depth: int) -> Iterator[Tuple[int, ...]]:
+        if used_mask == full_mask:
+            yield tuple(path[:depth])
             return
 
-        for i in range(start, len(quartile_candidates)):
-            combo, word = quartile_candidates[i]
-            if any(used[idx] for idx in combo):
+        # every cover must include the lowest free tile, so branching on it
+        # also guarantees each solution is generated exactly once
+        t = (~used_mask & (used_mask + 1)).bit_length() - 1
+        for i in by_tile[t]:
+            m = masks[i]
+            if used_mask & m:
                 continue  # overlaps – skip
+            path[depth] = i
+            yield from backtrack(used_mask | m, depth + 1)
 
-            # choose
-            for idx in combo:
-                used[idx] = True
-            stack.append((combo, word))
-
-            # explore deeper (always pick next candidate > i to avoid dupes)
-            backtrack(i + 1, stack)
-
-            # unchoose
-            stack.pop()
-            for idx in combo:
-                used[idx] = False
-
-    backtrack(0, [])
-    return solutions
+    for solution in backtrack(0, 0):
+        yield [groups[i] for i in solution]
 
 
 ###############################################################################
@@ -170,16 +477,16 @@ def find_perfect_quartiles(
 
 def print_solutions(
     tiles: Sequence[Tile],
-    perfect_solutions: List[List[Tuple[Combination, Word]]],
-    other_quartiles: List[Tuple[Combination, Word]],
-    other_words: List[Tuple[Combination, Word]],
+    perfect_solutions: List[List[List[Word]]],
+    other_quartiles: List[Tuple[Mask, Word]],
+    other_words: List[Tuple[Mask, Word]],
 ):
     if rich_available:
         table = Table(title="Quartile solutions", show_lines=True)
         table.add_column("#", justify="right")
         table.add_column("Quartiles (use every tile once)")
         for i, sol in enumerate(perfect_solutions, 1):
-            phrase = "  •  ".join(word for _, word in sol)
+            phrase = "  •  ".join("/".join(group) for group in sol)
             table.add_row(f"{i}", phrase)
         console.print(table)
 
@@ -192,7 +499,7 @@ def print_solutions(
     else:
         print("Quartile solutions:\n===============")
         for i, sol in enumerate(perfect_solutions, 1):
-            phrase = "  •  ".join(word for _, word in sol)
+            phrase = "  •  ".join("/".join(group) for group in sol)
             print(f"{i}. {phrase}")
         if other_quartiles:
             print("\nOther 4‑tile words:")
@@ -232,27 +539,57 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--all", action="store_true", help="Show every valid 1‑4 tile word."
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--max-solutions",
+        type=int,
+        default=20,
+        metavar="N",
+        help="Stop after N perfect covers (default: %(default)s).",
+    )
+    args = parser.parse_args()
+    if args.max_solutions < 0:
+        parser.error("--max-solutions must be a non‑negative integer")
+    return args
 
 
 def strip_known_tiles(tiles: List[Tile], known_words: Iterable[str]) -> List[Tile]:
-    """Remove tiles used in *all* known_words (best‑effort)."""
-    remaining = tiles.copy()
+    """Remove the tiles that spell each of ``known_words``.
+
+    A greedy left-to-right peel can fail on ambiguous tilings (e.g. tiles
+    ``a``/``ab``/``b`` against the word ``ab``), silently keeping all 20
+    tiles.  Instead, search every decomposition of the word into unused
+    tiles, memoizing dead (position, mask) states, so a tiling is found
+    whenever one exists.
+    """
+    taken_mask = 0
+
     for word in known_words:
         word = word.lower()
-        # greedy match – try to peel off a tile from the left until the word is gone
-        i = 0
-        while i < len(remaining) and word:
-            t = remaining[i]
-            if word.startswith(t):
-                word = word[len(t) :]
-                remaining.pop(i)
-            else:
-                i += 1
-        if word:
+        dead: Set[Tuple[int, int]] = set()
+
+        def match(pos: int, mask: int) -> int:
+            """Return the tile mask spelling ``word[pos:]``, or -1."""
+            if pos == len(word):
+                return mask
+            if (pos, mask) in dead:
+                return -1
+            for i, tile in enumerate(tiles):
+                if (taken_mask | mask) >> i & 1:
+                    continue
+                if word.startswith(tile, pos):
+                    found = match(pos + len(tile), mask | 1 << i)
+                    if found >= 0:
+                        return found
+            dead.add((pos, mask))
+            return -1
+
+        found = match(0, 0)
+        if found < 0:
             # Did not fully match – give up & keep original tiles so we don't break things
             return tiles
-    return remaining
+        taken_mask |= found
+
+    return [t for i, t in enumerate(tiles) if not taken_mask >> i & 1]
 
 
 def main() -> None:
@@ -265,12 +602,18 @@ def main() -> None:
     tiles = strip_known_tiles(tiles, args.known)
 
     wordset = load_wordset()
-    candidates = generate_candidates(tiles, wordset)
+    feasible = feasible_words(tiles, wordset)
+    tile_trie = build_tile_trie(
+        build_trie(feasible), tiles, build_prefix_bloom(feasible)
+    )
+    by_length = generate_candidates(tiles, tile_trie)
 
-    quartiles = [(c, w) for c, w in candidates if len(c) == 4]
-    others = [(c, w) for c, w in candidates if len(c) < 4]
+    quartiles = by_length[4]
+    others = [cw for r in range(1, 4) for cw in by_length[r]]
 
-    perfect = find_perfect_quartiles(tiles, quartiles)
+    perfect = list(
+        itertools.islice(find_perfect_quartiles(tiles, quartiles), args.max_solutions)
+    )
 
     # sort other quartiles by length then by word
     quartiles_sorted = sorted(